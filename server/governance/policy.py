@@ -6,6 +6,7 @@ Composes SQL governance + tool access control into a single policy.
 import os
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +17,7 @@ from server.governance.sql_guard import (
 )
 from server.governance.tool_guard import (
     ToolAccessPolicy,
+    TOOL_CATEGORIES,
     TOOL_PROFILES,
     resolve_tool_policy,
 )
@@ -51,6 +53,20 @@ class GovernancePolicy:
     tool_policy: ToolAccessPolicy
     _config: GovernanceConfig = field(repr=False)
 
+    @cached_property
+    def allowed_tools(self) -> frozenset[str]:
+        """Effective allow set over the registered tool universe.
+
+        Materialized on first access; membership is equivalent to
+        check_tool_access(name)[0] for every registered tool.
+        """
+        return frozenset(
+            tool
+            for tools in TOOL_CATEGORIES.values()
+            for tool in tools
+            if self.tool_policy.is_tool_allowed(tool)
+        )
+
     def check_tool_access(self, tool_name: str) -> tuple[bool, str]:
         """Check if a tool is accessible. Returns (allowed, error_msg)."""
         if self.tool_policy.is_tool_allowed(tool_name):
@@ -67,6 +83,15 @@ class GovernancePolicy:
             return True, ""
         return False, result.error_message
 
+    def check_sql_type(self, stmt_type: SQLStatementType) -> tuple[bool, str]:
+        """Check a pre-classified statement type without re-parsing SQL."""
+        return self.sql_governor.check_type(stmt_type)
+
+
+# Parsed-YAML cache keyed on path, invalidated via st_mtime_ns —
+# reloading an unchanged config file costs a single stat() call.
+_YAML_CACHE: dict[str, tuple[int, dict]] = {}
+
 
 def _load_yaml_config(path: str) -> dict:
     """Load governance config from YAML file."""
@@ -84,8 +109,17 @@ def _load_yaml_config(path: str) -> dict:
         logger.warning(f"Governance config file not found: {path}")
         return {}
 
+    mtime = config_path.stat().st_mtime_ns
+    hit = _YAML_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+
+    # Prefer the libyaml C loader when available (~3x faster parse).
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=loader) or {}
+    _YAML_CACHE[path] = (mtime, data)
+    return data
 
 
 def _parse_env_list(env_var: str) -> Optional[list[str]]:
@@ -196,7 +230,7 @@ def build_governance_policy(
     # Resolve SQL permissions
     sql_allowed: set[SQLStatementType] = set()
     if config.sql_profile and config.sql_profile in SQL_PROFILES:
-        sql_allowed = SQL_PROFILES[config.sql_profile].copy()
+        sql_allowed = set(SQL_PROFILES[config.sql_profile])
 
     if config.sql_allowed_types:
         for t in config.sql_allowed_types:
@@ -8,6 +8,7 @@ Replaces regex WRITE_PATTERNS with proper SQL parsing that handles:
 """
 import re
 import logging
+from functools import lru_cache
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass, field
@@ -59,23 +60,25 @@ _EXPRESSION_MAP: dict[type, SQLStatementType] = {
     exp.Grant: SQLStatementType.GRANT,
 }
 
-# Pre-built profiles
-PROFILES: dict[str, set[SQLStatementType]] = {
-    "read_only": {
+# Pre-built profiles — frozen so governors can share them without
+# defensive copies; derive overrides with set operators (e.g.
+# PROFILES["developer"] - {SQLStatementType.CREATE}).
+PROFILES: dict[str, frozenset[SQLStatementType]] = {
+    "read_only": frozenset({
         SQLStatementType.SELECT,
         SQLStatementType.SHOW,
         SQLStatementType.DESCRIBE,
         SQLStatementType.EXPLAIN,
-    },
-    "analyst": {
+    }),
+    "analyst": frozenset({
         SQLStatementType.SELECT,
         SQLStatementType.SHOW,
         SQLStatementType.DESCRIBE,
         SQLStatementType.EXPLAIN,
         SQLStatementType.INSERT,
         SQLStatementType.SET,
-    },
-    "developer": {
+    }),
+    "developer": frozenset({
         SQLStatementType.SELECT,
         SQLStatementType.INSERT,
         SQLStatementType.UPDATE,
@@ -87,11 +90,21 @@ PROFILES: dict[str, set[SQLStatementType]] = {
         SQLStatementType.EXPLAIN,
         SQLStatementType.SET,
         SQLStatementType.CALL,
-    },
-    "admin": set(SQLStatementType),
+    }),
+    "admin": frozenset(SQLStatementType),
 }
 
 
+# Statement types that never modify data — anything else routes as a write.
+_READ_TYPES: frozenset[SQLStatementType] = frozenset({
+    SQLStatementType.SELECT,
+    SQLStatementType.SHOW,
+    SQLStatementType.DESCRIBE,
+    SQLStatementType.EXPLAIN,
+    SQLStatementType.SET,
+})
+
+
 @dataclass
 class SQLCheckResult:
     """Result of checking a SQL statement against the policy."""
@@ -111,6 +124,9 @@ class SQLGovernor:
 
     def __init__(self, allowed_types: set[SQLStatementType]):
         self._allowed = allowed_types
+        # Denial messages list the permitted types; sort/join once here
+        # instead of on every denied check.
+        self._permitted_desc = ", ".join(sorted(t.value for t in allowed_types))
 
     @property
     def allowed_types(self) -> set[SQLStatementType]:
@@ -121,30 +137,23 @@ class SQLGovernor:
 
         Handles multi-statement SQL (semicolon-separated).
         Uses postgres dialect for accurate Lakebase parsing.
+        Classification is policy-independent, so results are memoized
+        and shared across governor instances.
         """
-        types: list[SQLStatementType] = []
-        try:
-            statements = sqlglot.parse(sql, dialect="postgres")
-            for stmt in statements:
-                if stmt is None:
-                    continue
-                stmt_type = self._classify_expression(stmt)
-                if stmt_type:
-                    types.append(stmt_type)
-                else:
-                    # Try regex fallback for this individual statement
-                    stmt_sql = stmt.sql(dialect="postgres")
-                    fallback = self._regex_fallback(stmt_sql)
-                    if fallback:
-                        types.append(fallback)
-        except sqlglot.errors.ParseError:
-            # Full fallback: use regex for unparseable SQL
-            stmt_type = self._regex_fallback(sql)
-            if stmt_type:
-                types.append(stmt_type)
-            else:
-                logger.warning(f"Could not parse SQL, will deny: {sql[:100]}")
-        return types
+        return list(_classify_sql(sql))
+
+    def check_type(self, stmt_type: SQLStatementType) -> tuple[bool, str]:
+        """Fast-path check for a pre-classified statement type.
+
+        Skips parsing entirely — a pure membership test against the
+        allowed set. Returns (allowed, error_msg).
+        """
+        if stmt_type in self._allowed:
+            return True, ""
+        return False, (
+            f"Statement type '{stmt_type.value}' is not allowed. "
+            f"Permitted types: {self._permitted_desc}"
+        )
 
     def check(self, sql: str) -> SQLCheckResult:
         """Check if SQL is allowed by current policy."""
@@ -158,14 +167,13 @@ class SQLGovernor:
 
         for stmt_type in types:
             if stmt_type not in self._allowed:
-                allowed_list = sorted(t.value for t in self._allowed)
                 return SQLCheckResult(
                     allowed=False,
                     statement_type=stmt_type,
                     parsed_types=types,
                     error_message=(
                         f"Statement type '{stmt_type.value}' is not allowed. "
-                        f"Permitted types: {', '.join(allowed_list)}"
+                        f"Permitted types: {self._permitted_desc}"
                     ),
                 )
 
@@ -177,80 +185,267 @@ class SQLGovernor:
 
     def is_write(self, sql: str) -> bool:
         """Check if SQL contains any write operations (for routing decisions)."""
-        read_types = {
-            SQLStatementType.SELECT,
-            SQLStatementType.SHOW,
-            SQLStatementType.DESCRIBE,
-            SQLStatementType.EXPLAIN,
-            SQLStatementType.SET,
+        return any(t not in _READ_TYPES for t in _classify_sql(sql))
+
+
+def _classify_expression(node: exp.Expression) -> Optional[SQLStatementType]:
+    """Map a sqlglot expression node to a SQLStatementType."""
+    for expr_type, stmt_type in _EXPRESSION_MAP.items():
+        if isinstance(node, expr_type):
+            return stmt_type
+
+    # Handle Command expressions (EXPLAIN, SHOW, REVOKE, CALL, etc.)
+    # In sqlglot v28+, EXPLAIN and SHOW are parsed as Command nodes.
+    if isinstance(node, exp.Command):
+        cmd = node.this.upper() if isinstance(node.this, str) else ""
+        cmd_map = {
+            "EXPLAIN": SQLStatementType.EXPLAIN,
+            "REVOKE": SQLStatementType.REVOKE,
+            "SHOW": SQLStatementType.SHOW,
+            "SET": SQLStatementType.SET,
+            "CALL": SQLStatementType.CALL,
         }
-        types = self.classify(sql)
-        return any(t not in read_types for t in types)
-
-    def _classify_expression(
-        self, node: exp.Expression
-    ) -> Optional[SQLStatementType]:
-        """Map a sqlglot expression node to a SQLStatementType."""
-        for expr_type, stmt_type in _EXPRESSION_MAP.items():
-            if isinstance(node, expr_type):
-                return stmt_type
-
-        # Handle Command expressions (EXPLAIN, SHOW, REVOKE, CALL, etc.)
-        # In sqlglot v28+, EXPLAIN and SHOW are parsed as Command nodes.
-        if isinstance(node, exp.Command):
-            cmd = node.this.upper() if isinstance(node.this, str) else ""
-            cmd_map = {
-                "EXPLAIN": SQLStatementType.EXPLAIN,
-                "REVOKE": SQLStatementType.REVOKE,
-                "SHOW": SQLStatementType.SHOW,
-                "SET": SQLStatementType.SET,
-                "CALL": SQLStatementType.CALL,
-            }
-            return cmd_map.get(cmd)
-
-        # SetItem for SET statements
-        if isinstance(node, exp.SetItem) or isinstance(node, exp.Set):
-            return SQLStatementType.SET
-
-        # Describe
-        if isinstance(node, exp.Describe):
-            return SQLStatementType.DESCRIBE
-
-        # Use
-        if isinstance(node, exp.Use):
-            return SQLStatementType.USE
-
-        logger.debug(f"Unrecognized expression type: {type(node).__name__}")
+        return cmd_map.get(cmd)
+
+    # SetItem for SET statements
+    if isinstance(node, exp.SetItem) or isinstance(node, exp.Set):
+        return SQLStatementType.SET
+
+    # Describe
+    if isinstance(node, exp.Describe):
+        return SQLStatementType.DESCRIBE
+
+    # Use
+    if isinstance(node, exp.Use):
+        return SQLStatementType.USE
+
+    logger.debug(f"Unrecognized expression type: {type(node).__name__}")
+    return None
+
+
+# Single precompiled alternation for the regex fallback — one engine
+# pass instead of up to 21 sequential re.match calls. Group names map
+# to statement types; "with_*" groups classify CTE prefixes by their
+# outer statement.
+_FALLBACK_RE = re.compile(
+    r"^(?:"
+    r"(?P<select>SELECT\b)"
+    r"|(?P<insert>INSERT\b)"
+    r"|(?P<update>UPDATE\b)"
+    r"|(?P<delete>DELETE\b)"
+    r"|(?P<create>CREATE\b)"
+    r"|(?P<drop>DROP\b)"
+    r"|(?P<alter>ALTER\b)"
+    r"|(?P<merge>MERGE\b)"
+    r"|(?P<truncate>TRUNCATE\b)"
+    r"|(?P<grant>GRANT\b)"
+    r"|(?P<revoke>REVOKE\b)"
+    r"|(?P<explain>EXPLAIN\b)"
+    r"|(?P<show>SHOW\b)"
+    r"|(?P<describe>DESCRIBE\b)"
+    r"|(?P<set>SET\b)"
+    r"|(?P<call>CALL\b)"
+    r"|(?P<use>USE\b)"
+    # CTE detection
+    r"|(?P<with_select>WITH\b.*\bSELECT\b)"
+    r"|(?P<with_insert>WITH\b.*\bINSERT\b)"
+    r"|(?P<with_update>WITH\b.*\bUPDATE\b)"
+    r"|(?P<with_delete>WITH\b.*\bDELETE\b)"
+    r")",
+    re.DOTALL,
+)
+
+_FALLBACK_TYPES: dict[str, SQLStatementType] = {
+    **{t.value: t for t in SQLStatementType},
+    "with_select": SQLStatementType.SELECT,
+    "with_insert": SQLStatementType.INSERT,
+    "with_update": SQLStatementType.UPDATE,
+    "with_delete": SQLStatementType.DELETE,
+}
+
+
+def _regex_fallback(sql: str) -> Optional[SQLStatementType]:
+    """Regex fallback for statements sqlglot cannot parse."""
+    m = _FALLBACK_RE.match(sql.strip().upper())
+    if m is None:
         return None
+    return _FALLBACK_TYPES[m.lastgroup]
 
-    def _regex_fallback(self, sql: str) -> Optional[SQLStatementType]:
-        """Regex fallback for statements sqlglot cannot parse."""
-        stripped = sql.strip().upper()
-        patterns = [
-            (r"^SELECT\b", SQLStatementType.SELECT),
-            (r"^INSERT\b", SQLStatementType.INSERT),
-            (r"^UPDATE\b", SQLStatementType.UPDATE),
-            (r"^DELETE\b", SQLStatementType.DELETE),
-            (r"^CREATE\b", SQLStatementType.CREATE),
-            (r"^DROP\b", SQLStatementType.DROP),
-            (r"^ALTER\b", SQLStatementType.ALTER),
-            (r"^MERGE\b", SQLStatementType.MERGE),
-            (r"^TRUNCATE\b", SQLStatementType.TRUNCATE),
-            (r"^GRANT\b", SQLStatementType.GRANT),
-            (r"^REVOKE\b", SQLStatementType.REVOKE),
-            (r"^EXPLAIN\b", SQLStatementType.EXPLAIN),
-            (r"^SHOW\b", SQLStatementType.SHOW),
-            (r"^DESCRIBE\b", SQLStatementType.DESCRIBE),
-            (r"^SET\b", SQLStatementType.SET),
-            (r"^CALL\b", SQLStatementType.CALL),
-            (r"^USE\b", SQLStatementType.USE),
-            # CTE detection
-            (r"^WITH\b.*\bSELECT\b", SQLStatementType.SELECT),
-            (r"^WITH\b.*\bINSERT\b", SQLStatementType.INSERT),
-            (r"^WITH\b.*\bUPDATE\b", SQLStatementType.UPDATE),
-            (r"^WITH\b.*\bDELETE\b", SQLStatementType.DELETE),
-        ]
-        for pattern, stmt_type in patterns:
-            if re.match(pattern, stripped, re.DOTALL):
-                return stmt_type
+
+# First keywords that uniquely determine the statement type. Lets
+# classification skip the sqlglot parse for single statements whose
+# head keyword _fast_head can resolve; anything else (multi-statement
+# SQL, tokenizer bail-outs) falls through to the parser.
+_HEAD_KEYWORDS: dict[str, SQLStatementType] = {
+    "SELECT": SQLStatementType.SELECT,
+    "INSERT": SQLStatementType.INSERT,
+    "UPDATE": SQLStatementType.UPDATE,
+    "DELETE": SQLStatementType.DELETE,
+    "CREATE": SQLStatementType.CREATE,
+    "DROP": SQLStatementType.DROP,
+    "ALTER": SQLStatementType.ALTER,
+    "MERGE": SQLStatementType.MERGE,
+    "TRUNCATE": SQLStatementType.TRUNCATE,
+    "GRANT": SQLStatementType.GRANT,
+    "REVOKE": SQLStatementType.REVOKE,
+    "EXPLAIN": SQLStatementType.EXPLAIN,
+    "SHOW": SQLStatementType.SHOW,
+    "DESCRIBE": SQLStatementType.DESCRIBE,
+    "SET": SQLStatementType.SET,
+    "CALL": SQLStatementType.CALL,
+    "USE": SQLStatementType.USE,
+}
+
+
+def _fast_head(sql: str) -> Optional[str]:
+    """Return the head keyword of a single statement without parsing.
+
+    Linear scan that skips whitespace, ``--`` and ``/* */`` comments,
+    and one paren-balanced ``WITH ...`` CTE prefix (tracking string
+    literals and quoted identifiers so parens inside them don't count),
+    then reads the next bare keyword. Returns None whenever the scan
+    can't resolve the head unambiguously — the caller falls back to the
+    full sqlglot parse, so bailing out is always safe.
+    """
+    n = len(sql)
+
+    def skip_ws_comments(i: int) -> int:
+        while i < n:
+            c = sql[i]
+            if c.isspace():
+                i += 1
+            elif sql.startswith("--", i):
+                j = sql.find("\n", i)
+                i = n if j < 0 else j + 1
+            elif sql.startswith("/*", i):
+                # Postgres block comments nest; track depth so a "*/"
+                # inside a nested comment doesn't end the outer one.
+                depth = 1
+                i += 2
+                while i < n and depth:
+                    if sql.startswith("/*", i):
+                        depth += 1
+                        i += 2
+                    elif sql.startswith("*/", i):
+                        depth -= 1
+                        i += 2
+                    else:
+                        i += 1
+                if depth:
+                    return n
+            else:
+                break
+        return i
+
+    def read_word(i: int) -> tuple[str, int]:
+        # Digits are part of the token: "SELECT1" is an identifier, not
+        # the SELECT keyword, and must fall through to the parser.
+        start = i
+        while i < n and (sql[i].isalnum() or sql[i] == "_"):
+            i += 1
+        return sql[start:i].upper(), i
+
+    i = skip_ws_comments(0)
+    word, i = read_word(i)
+    if word != "WITH":
+        return word or None
+
+    # Dollar-quoted strings ($$..$$, $tag$..$tag$) and backslash escapes
+    # (E'..\'..') aren't tracked by the scan below; either could hide a
+    # ")" that ends the CTE scan early and misreads the outer keyword.
+    # Bail to the full parse whenever they might be present.
+    if "$" in sql or "\\" in sql:
         return None
+
+    # Scan past the CTE list. Each top-level ")" either continues the
+    # list (next token "," or the AS between a column list and its
+    # body) or ends it — then the next word is the outer statement.
+    depth = 0
+    while i < n:
+        c = sql[i]
+        if c == "(":
+            depth += 1
+            i += 1
+        elif c == ")":
+            depth -= 1
+            i += 1
+            if depth < 0:
+                return None
+            if depth == 0:
+                i = skip_ws_comments(i)
+                if i < n and sql[i] == ",":
+                    i += 1
+                    continue
+                word, j = read_word(i)
+                if word == "AS":
+                    i = j
+                    continue
+                return word or None
+        elif c == "'":
+            # Single-quoted literal; '' is an escaped quote.
+            j = i + 1
+            while True:
+                j = sql.find("'", j)
+                if j < 0:
+                    return None
+                if j + 1 < n and sql[j + 1] == "'":
+                    j += 2
+                    continue
+                break
+            i = j + 1
+        elif c == '"':
+            j = sql.find('"', i + 1)
+            if j < 0:
+                return None
+            i = j + 1
+        elif sql.startswith("--", i) or sql.startswith("/*", i):
+            i = skip_ws_comments(i)
+        else:
+            i += 1
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _classify_sql(sql: str) -> tuple[SQLStatementType, ...]:
+    """Classify a SQL string into statement types (memoized).
+
+    Classification depends only on the SQL text, never on the governor's
+    allowed set, so repeated statements are parsed exactly once.
+    """
+    # Empty, whitespace-only, or bare-semicolon input contains no
+    # statements — skip sqlglot entirely.
+    stripped = sql.strip()
+    if not stripped.strip(";").strip():
+        return ()
+
+    # Fast path: a lone statement whose head keyword is unambiguous
+    # needs no AST — a linear byte scan vs a ~1ms sqlglot parse.
+    if ";" not in stripped:
+        head = _fast_head(stripped)
+        stmt_type = _HEAD_KEYWORDS.get(head) if head is not None else None
+        if stmt_type is not None:
+            return (stmt_type,)
+
+    types: list[SQLStatementType] = []
+    try:
+        statements = sqlglot.parse(sql, dialect="postgres")
+        for stmt in statements:
+            if stmt is None:
+                continue
+            stmt_type = _classify_expression(stmt)
+            if stmt_type:
+                types.append(stmt_type)
+            else:
+                # Try regex fallback for this individual statement
+                stmt_sql = stmt.sql(dialect="postgres")
+                fallback = _regex_fallback(stmt_sql)
+                if fallback:
+                    types.append(fallback)
+    except sqlglot.errors.ParseError:
+        # Full fallback: use regex for unparseable SQL
+        stmt_type = _regex_fallback(sql)
+        if stmt_type:
+            types.append(stmt_type)
+        else:
+            logger.warning(f"Could not parse SQL, will deny: {sql[:100]}")
+    return tuple(types)
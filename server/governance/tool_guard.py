@@ -5,6 +5,7 @@ Configurable via env vars or YAML governance config.
 """
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -118,27 +119,53 @@ TOOL_PROFILES: dict[str, list[str]] = {
     "admin": list(TOOL_CATEGORIES.keys()),
 }
 
+# Profile → category membership as frozensets, computed once at import
+# for O(1) subset/containment checks without rebuilding sets.
+PROFILE_CATEGORY_SETS: dict[str, frozenset[str]] = {
+    profile: frozenset(categories)
+    for profile, categories in TOOL_PROFILES.items()
+}
+
+# Profile → full tool-name expansion, computed once at import. Lets
+# resolve_tool_policy hand a shared frozenset straight to the policy
+# instead of re-flattening categories on every call.
+PROFILE_TOOLS: dict[str, frozenset[str]] = {
+    profile: frozenset(
+        tool
+        for cat in categories
+        if cat in TOOL_CATEGORIES
+        for tool in TOOL_CATEGORIES[cat]
+    )
+    for profile, categories in TOOL_PROFILES.items()
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class ToolAccessPolicy:
     """Resolved tool access policy."""
 
-    allowed_tools: set[str] = field(default_factory=set)
-    denied_tools: set[str] = field(default_factory=set)
+    allowed_tools: frozenset[str] = field(default_factory=frozenset)
+    denied_tools: frozenset[str] = field(default_factory=frozenset)
+    _allow_all: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Normalize caller-supplied sets and cache the permissive-default
+        # flag so the hot path is two hash probes at most.
+        self.allowed_tools = frozenset(self.allowed_tools)
+        self.denied_tools = frozenset(self.denied_tools)
+        self._allow_all = not self.allowed_tools
 
     def is_tool_allowed(self, tool_name: str) -> bool:
         """Check if a specific tool is allowed.
 
         Logic:
-        1. If deny list has entries and tool is in deny list -> DENIED
+        1. If tool is in deny list -> DENIED
         2. If allow list has entries and tool is NOT in allow list -> DENIED
         3. If neither list has entries -> ALLOWED (permissive default for backward compat)
         """
-        if self.denied_tools and tool_name in self.denied_tools:
-            return False
-        if self.allowed_tools and tool_name not in self.allowed_tools:
-            return False
-        return True
+        return tool_name not in self.denied_tools and (
+            self._allow_all or tool_name in self.allowed_tools
+        )
 
 
 def resolve_tool_policy(
@@ -154,32 +181,54 @@ def resolve_tool_policy(
     1. Profile expands to category list
     2. allowed_categories / denied_categories override profile
     3. allowed_tools / denied_tools override everything (individual tool names)
-    """
-    policy = ToolAccessPolicy()
-
-    # Step 1: Expand profile to tool names
-    if profile and profile in TOOL_PROFILES:
-        categories = TOOL_PROFILES[profile]
-        for cat in categories:
-            if cat in TOOL_CATEGORIES:
-                policy.allowed_tools.update(TOOL_CATEGORIES[cat])
-
-    # Step 2: Apply category overrides
-    if allowed_categories:
-        for cat in allowed_categories:
-            if cat in TOOL_CATEGORIES:
-                policy.allowed_tools.update(TOOL_CATEGORIES[cat])
 
+    Resolution is memoized on the argument tuple — repeated calls with
+    the same config return a shared policy instance, so callers must
+    treat the result as read-only.
+    """
+    return _resolve_tool_policy(
+        profile,
+        tuple(allowed_categories) if allowed_categories else None,
+        tuple(denied_categories) if denied_categories else None,
+        tuple(allowed_tools) if allowed_tools else None,
+        tuple(denied_tools) if denied_tools else None,
+    )
+
+
+@lru_cache(maxsize=32)
+def _resolve_tool_policy(
+    profile: Optional[str],
+    allowed_categories: Optional[tuple[str, ...]],
+    denied_categories: Optional[tuple[str, ...]],
+    allowed_tools: Optional[tuple[str, ...]],
+    denied_tools: Optional[tuple[str, ...]],
+) -> ToolAccessPolicy:
+    # Step 1: Expand profile to tool names. With no allow overrides the
+    # precomputed frozenset is shared directly — no copy, no flattening.
+    if profile in PROFILE_TOOLS and not allowed_categories and not allowed_tools:
+        allowed = PROFILE_TOOLS[profile]
+    else:
+        merged: set[str] = set()
+        if profile in PROFILE_TOOLS:
+            merged |= PROFILE_TOOLS[profile]
+
+        # Step 2: Apply category overrides
+        if allowed_categories:
+            for cat in allowed_categories:
+                if cat in TOOL_CATEGORIES:
+                    merged.update(TOOL_CATEGORIES[cat])
+
+        # Step 3: Apply individual tool overrides
+        if allowed_tools:
+            merged.update(allowed_tools)
+        allowed = frozenset(merged)
+
+    denied: set[str] = set()
     if denied_categories:
         for cat in denied_categories:
             if cat in TOOL_CATEGORIES:
-                policy.denied_tools.update(TOOL_CATEGORIES[cat])
-
-    # Step 3: Apply individual tool overrides
-    if allowed_tools:
-        policy.allowed_tools.update(allowed_tools)
-
+                denied.update(TOOL_CATEGORIES[cat])
     if denied_tools:
-        policy.denied_tools.update(denied_tools)
+        denied.update(denied_tools)
 
-    return policy
+    return ToolAccessPolicy(allowed_tools=allowed, denied_tools=frozenset(denied))
@@ -3,6 +3,7 @@
 Uses sqlglot-based SQL governance for fine-grained statement-type permissions.
 """
 import json
+import re
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional
 from mcp.server.fastmcp import FastMCP
@@ -14,6 +15,27 @@ from server.governance.policy import GovernancePolicy
 from server.governance.sql_guard import SQLStatementType
 
 
+# Admin functions never exposed through the query tools; the pattern is
+# compiled once so validation is a single scan instead of one lowered
+# substring search per function name per call.
+_BLOCKED_FUNCS = frozenset({
+    "pg_terminate_backend",
+    "pg_cancel_backend",
+    "pg_reload_conf",
+})
+_BLOCKED_FUNC_RE = re.compile(
+    "|".join(map(re.escape, sorted(_BLOCKED_FUNCS))), re.IGNORECASE
+)
+
+# Statement types lakebase_read_query accepts regardless of governance.
+_READ_QUERY_TYPES = frozenset({
+    SQLStatementType.SELECT,
+    SQLStatementType.EXPLAIN,
+    SQLStatementType.SHOW,
+    SQLStatementType.DESCRIBE,
+})
+
+
 class ExecuteQueryInput(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
     sql: str = Field(
@@ -30,10 +52,9 @@ class ExecuteQueryInput(BaseModel):
     @field_validator("sql")
     @classmethod
     def validate_no_dangerous(cls, v: str) -> str:
-        dangerous = ["pg_terminate_backend", "pg_cancel_backend", "pg_reload_conf"]
-        for d in dangerous:
-            if d.lower() in v.lower():
-                raise ValueError(f"Query contains blocked function: {d}")
+        m = _BLOCKED_FUNC_RE.search(v)
+        if m:
+            raise ValueError(f"Query contains blocked function: {m.group(0).lower()}")
         return v
 
 
@@ -105,14 +126,8 @@ def register_query_tools(mcp: FastMCP, governance: GovernancePolicy):
         """
         try:
             # read_query always enforces SELECT/EXPLAIN-only regardless of governance
-            read_allowed = {
-                SQLStatementType.SELECT,
-                SQLStatementType.EXPLAIN,
-                SQLStatementType.SHOW,
-                SQLStatementType.DESCRIBE,
-            }
             types = governance.sql_governor.classify(params.sql)
-            if not types or any(t not in read_allowed for t in types):
+            if not types or any(t not in _READ_QUERY_TYPES for t in types):
                 return (
                     "Error: Only SELECT, EXPLAIN, SHOW, and DESCRIBE queries "
                     "are allowed with read_query. "
@@ -2,6 +2,50 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from server.governance.sql_guard import SQLGovernor, SQLStatementType, PROFILES
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_governance():
+    """Pre-build a governance policy once before any test runs.
+
+    Forces the governance module imports (SQL classifier regexes,
+    TOOL_CATEGORIES expansion, PROFILES construction) so the first
+    timed test doesn't pay the one-off setup cost.
+    """
+    from server.governance.policy import GovernanceConfig, build_governance_policy
+
+    build_governance_policy(GovernanceConfig())
+
+
+# Session-scoped governors — SQLGovernor is read-only once built, so one
+# instance per profile serves every test instead of one per invocation.
+
+@pytest.fixture(scope="session")
+def read_only_governor():
+    return SQLGovernor(PROFILES["read_only"])
+
+
+@pytest.fixture(scope="session")
+def analyst_governor():
+    return SQLGovernor(PROFILES["analyst"])
+
+
+@pytest.fixture(scope="session")
+def developer_governor():
+    return SQLGovernor(PROFILES["developer"])
+
+
+@pytest.fixture(scope="session")
+def admin_governor():
+    return SQLGovernor(PROFILES["admin"])
+
+
+@pytest.fixture(scope="session")
+def all_types_governor():
+    """Governor permitting every statement type — for classification tests."""
+    return SQLGovernor(frozenset(SQLStatementType))
+
 
 @pytest.fixture
 def mock_pool():
@@ -12,9 +56,10 @@ def mock_pool():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_columns():
-    return [
+    # Session-scoped shared data — treat as read-only in tests.
+    return (
         {
             "column_name": "id",
             "data_type": "integer",
@@ -33,15 +78,15 @@ def sample_columns():
             "is_nullable": "NO",
             "column_default": "now()",
         },
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rows():
-    return [
+    return (
         {"id": 1, "name": "Alice", "email": "alice@example.com"},
         {"id": 2, "name": "Bob", "email": "bob@example.com"},
-    ]
+    )
 
 
 @pytest.fixture
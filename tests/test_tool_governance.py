@@ -7,6 +7,7 @@ import pytest
 from server.governance.tool_guard import (
     TOOL_CATEGORIES,
     TOOL_PROFILES,
+    PROFILE_CATEGORY_SETS,
     ToolAccessPolicy,
     resolve_tool_policy,
 )
@@ -14,101 +15,88 @@ from server.governance.tool_guard import (
 
 # ── All 31 Tools ──────────────────────────────────────────────────────
 
-ALL_TOOLS = sorted(
+# Frozenset for O(1) membership/coverage checks; sorted tuple only where
+# parametrize needs stable ordering.
+ALL_TOOLS_SET = frozenset(
     tool for tools in TOOL_CATEGORIES.values() for tool in tools
 )
+ALL_TOOLS = tuple(sorted(ALL_TOOLS_SET))
 
 # ── Category Definitions ──────────────────────────────────────────────
 
 class TestToolCategories:
     """Verify category definitions are complete and correct."""
 
-    def test_total_categories(self):
-        assert len(TOOL_CATEGORIES) == 14
-
-    def test_total_tools(self):
-        assert len(ALL_TOOLS) == 31
-
-    def test_no_duplicate_tools(self):
-        all_tools_flat = [t for tools in TOOL_CATEGORIES.values() for t in tools]
-        assert len(all_tools_flat) == len(set(all_tools_flat)), "Duplicate tool found across categories"
-
-    def test_sql_query_category(self):
-        assert set(TOOL_CATEGORIES["sql_query"]) == {
+    # Expected membership per category — one parametrized comparison
+    # kernel instead of 14 near-identical methods.
+    EXPECTED_CATEGORIES: dict[str, frozenset[str]] = {
+        "sql_query": frozenset({
             "lakebase_execute_query",
             "lakebase_read_query",
             "lakebase_explain_query",
-        }
-
-    def test_schema_read_category(self):
-        assert set(TOOL_CATEGORIES["schema_read"]) == {
+        }),
+        "schema_read": frozenset({
             "lakebase_list_schemas",
             "lakebase_list_tables",
             "lakebase_describe_table",
             "lakebase_object_tree",
-        }
-
-    def test_project_read_category(self):
-        assert set(TOOL_CATEGORIES["project_read"]) == {
+        }),
+        "project_read": frozenset({
             "lakebase_list_projects",
             "lakebase_describe_project",
             "lakebase_get_connection_string",
-        }
-
-    def test_branch_read_category(self):
-        assert TOOL_CATEGORIES["branch_read"] == ["lakebase_list_branches"]
-
-    def test_branch_write_category(self):
-        assert set(TOOL_CATEGORIES["branch_write"]) == {
+        }),
+        "branch_read": frozenset({"lakebase_list_branches"}),
+        "branch_write": frozenset({
             "lakebase_create_branch",
             "lakebase_delete_branch",
-        }
-
-    def test_compute_read_category(self):
-        assert set(TOOL_CATEGORIES["compute_read"]) == {
+        }),
+        "compute_read": frozenset({
             "lakebase_get_compute_status",
             "lakebase_get_compute_metrics",
-        }
-
-    def test_compute_write_category(self):
-        assert set(TOOL_CATEGORIES["compute_write"]) == {
+        }),
+        "compute_write": frozenset({
             "lakebase_configure_autoscaling",
             "lakebase_configure_scale_to_zero",
             "lakebase_restart_compute",
             "lakebase_create_read_replica",
-        }
-
-    def test_migration_category(self):
-        assert set(TOOL_CATEGORIES["migration"]) == {
+        }),
+        "migration": frozenset({
             "lakebase_prepare_migration",
             "lakebase_complete_migration",
-        }
-
-    def test_sync_read_category(self):
-        assert TOOL_CATEGORIES["sync_read"] == ["lakebase_list_syncs"]
-
-    def test_sync_write_category(self):
-        assert TOOL_CATEGORIES["sync_write"] == ["lakebase_create_sync"]
-
-    def test_quality_category(self):
-        assert TOOL_CATEGORIES["quality"] == ["lakebase_profile_table"]
-
-    def test_feature_read_category(self):
-        assert set(TOOL_CATEGORIES["feature_read"]) == {
+        }),
+        "sync_read": frozenset({"lakebase_list_syncs"}),
+        "sync_write": frozenset({"lakebase_create_sync"}),
+        "quality": frozenset({"lakebase_profile_table"}),
+        "feature_read": frozenset({
             "lakebase_lookup_features",
             "lakebase_list_feature_tables",
-        }
-
-    def test_insight_category(self):
-        assert TOOL_CATEGORIES["insight"] == ["lakebase_append_insight"]
-
-    def test_uc_governance_category(self):
-        assert set(TOOL_CATEGORIES["uc_governance"]) == {
+        }),
+        "insight": frozenset({"lakebase_append_insight"}),
+        "uc_governance": frozenset({
             "lakebase_get_uc_permissions",
             "lakebase_check_my_access",
             "lakebase_governance_summary",
             "lakebase_list_catalog_grants",
-        }
+        }),
+    }
+
+    def test_total_categories(self):
+        assert len(TOOL_CATEGORIES) == 14
+
+    def test_total_tools(self):
+        assert len(ALL_TOOLS) == 31
+
+    def test_no_duplicate_tools(self):
+        all_tools_flat = [t for tools in TOOL_CATEGORIES.values() for t in tools]
+        assert len(all_tools_flat) == len(ALL_TOOLS_SET), "Duplicate tool found across categories"
+
+    def test_all_categories_expected(self):
+        assert set(TOOL_CATEGORIES) == set(self.EXPECTED_CATEGORIES)
+
+    @pytest.mark.parametrize("cat,expected", sorted(EXPECTED_CATEGORIES.items()))
+    def test_category_membership(self, cat, expected):
+        assert frozenset(TOOL_CATEGORIES[cat]) == expected
 
 
 # ── Profile Definitions ──────────────────────────────────────────────
@@ -137,14 +125,14 @@ class TestToolProfiles:
         assert TOOL_PROFILES["developer"] == expected
 
     def test_admin_has_all_categories(self):
-        assert set(TOOL_PROFILES["admin"]) == set(TOOL_CATEGORIES.keys())
+        assert PROFILE_CATEGORY_SETS["admin"] == frozenset(TOOL_CATEGORIES)
 
     def test_profile_hierarchy(self):
         """Each profile's category set is a superset of the previous."""
-        ro = set(TOOL_PROFILES["read_only"])
-        an = set(TOOL_PROFILES["analyst"])
-        dev = set(TOOL_PROFILES["developer"])
-        adm = set(TOOL_PROFILES["admin"])
+        ro = PROFILE_CATEGORY_SETS["read_only"]
+        an = PROFILE_CATEGORY_SETS["analyst"]
+        dev = PROFILE_CATEGORY_SETS["developer"]
+        adm = PROFILE_CATEGORY_SETS["admin"]
 
         assert ro == an  # analyst == read_only for tools
         assert ro.issubset(dev)
@@ -203,39 +191,55 @@ class TestToolAccessPolicy:
 class TestResolveToolPolicy:
     """Test the policy resolution function."""
 
+    @staticmethod
+    def _verdicts(policy, expected: dict[str, bool]) -> None:
+        """Assert is_tool_allowed verdicts in one comparison.
+
+        A single dict equality keeps one frame per scenario and lets the
+        assert rewriter show every mismatched tool at once.
+        """
+        got = {tool: policy.is_tool_allowed(tool) for tool in expected}
+        assert got == expected
+
     def test_read_only_profile_resolves(self):
         policy = resolve_tool_policy(profile="read_only")
-        # read_only should allow all tools in read categories
-        assert policy.is_tool_allowed("lakebase_read_query") is True
-        assert policy.is_tool_allowed("lakebase_list_schemas") is True
-        assert policy.is_tool_allowed("lakebase_list_tables") is True
-        assert policy.is_tool_allowed("lakebase_profile_table") is True
-        assert policy.is_tool_allowed("lakebase_get_uc_permissions") is True
-        # Should deny write tools
-        assert policy.is_tool_allowed("lakebase_create_branch") is False
-        assert policy.is_tool_allowed("lakebase_delete_branch") is False
-        assert policy.is_tool_allowed("lakebase_configure_autoscaling") is False
-        assert policy.is_tool_allowed("lakebase_restart_compute") is False
-        assert policy.is_tool_allowed("lakebase_prepare_migration") is False
-        assert policy.is_tool_allowed("lakebase_create_sync") is False
+        self._verdicts(policy, {
+            # read_only should allow all tools in read categories
+            "lakebase_read_query": True,
+            "lakebase_list_schemas": True,
+            "lakebase_list_tables": True,
+            "lakebase_profile_table": True,
+            "lakebase_get_uc_permissions": True,
+            # Should deny write tools
+            "lakebase_create_branch": False,
+            "lakebase_delete_branch": False,
+            "lakebase_configure_autoscaling": False,
+            "lakebase_restart_compute": False,
+            "lakebase_prepare_migration": False,
+            "lakebase_create_sync": False,
+        })
 
     def test_analyst_profile_resolves(self):
         policy = resolve_tool_policy(profile="analyst")
         # Same as read_only
-        assert policy.is_tool_allowed("lakebase_read_query") is True
-        assert policy.is_tool_allowed("lakebase_create_branch") is False
-        assert policy.is_tool_allowed("lakebase_prepare_migration") is False
+        self._verdicts(policy, {
+            "lakebase_read_query": True,
+            "lakebase_create_branch": False,
+            "lakebase_prepare_migration": False,
+        })
 
     def test_developer_profile_resolves(self):
         policy = resolve_tool_policy(profile="developer")
         # Has all read + write categories except admin-only
-        assert policy.is_tool_allowed("lakebase_read_query") is True
-        assert policy.is_tool_allowed("lakebase_create_branch") is True
-        assert policy.is_tool_allowed("lakebase_delete_branch") is True
-        assert policy.is_tool_allowed("lakebase_configure_autoscaling") is True
-        assert policy.is_tool_allowed("lakebase_prepare_migration") is True
-        assert policy.is_tool_allowed("lakebase_create_sync") is True
-        assert policy.is_tool_allowed("lakebase_get_uc_permissions") is True
+        self._verdicts(policy, {
+            "lakebase_read_query": True,
+            "lakebase_create_branch": True,
+            "lakebase_delete_branch": True,
+            "lakebase_configure_autoscaling": True,
+            "lakebase_prepare_migration": True,
+            "lakebase_create_sync": True,
+            "lakebase_get_uc_permissions": True,
+        })
 
     def test_admin_profile_resolves(self):
         policy = resolve_tool_policy(profile="admin")
@@ -248,12 +252,14 @@ class TestResolveToolPolicy:
             profile="developer",
             denied_categories=["compute_write", "migration"],
         )
-        assert policy.is_tool_allowed("lakebase_read_query") is True
-        assert policy.is_tool_allowed("lakebase_create_branch") is True
-        assert policy.is_tool_allowed("lakebase_configure_autoscaling") is False
-        assert policy.is_tool_allowed("lakebase_restart_compute") is False
-        assert policy.is_tool_allowed("lakebase_prepare_migration") is False
-        assert policy.is_tool_allowed("lakebase_get_compute_status") is True  # compute_read not denied
+        self._verdicts(policy, {
+            "lakebase_read_query": True,
+            "lakebase_create_branch": True,
+            "lakebase_configure_autoscaling": False,
+            "lakebase_restart_compute": False,
+            "lakebase_prepare_migration": False,
+            "lakebase_get_compute_status": True,  # compute_read not denied
+        })
 
     def test_individual_tool_deny(self):
         """Admin profile with specific tools denied."""
@@ -261,21 +267,25 @@ class TestResolveToolPolicy:
             profile="admin",
             denied_tools=["lakebase_execute_query", "lakebase_delete_branch"],
         )
-        assert policy.is_tool_allowed("lakebase_read_query") is True
-        assert policy.is_tool_allowed("lakebase_execute_query") is False
-        assert policy.is_tool_allowed("lakebase_create_branch") is True
-        assert policy.is_tool_allowed("lakebase_delete_branch") is False
+        self._verdicts(policy, {
+            "lakebase_read_query": True,
+            "lakebase_execute_query": False,
+            "lakebase_create_branch": True,
+            "lakebase_delete_branch": False,
+        })
 
     def test_category_allow_override(self):
         """No profile, but specific categories allowed."""
         policy = resolve_tool_policy(
             allowed_categories=["sql_query", "schema_read"],
         )
-        assert policy.is_tool_allowed("lakebase_read_query") is True
-        assert policy.is_tool_allowed("lakebase_execute_query") is True
-        assert policy.is_tool_allowed("lakebase_list_schemas") is True
-        assert policy.is_tool_allowed("lakebase_create_branch") is False
-        assert policy.is_tool_allowed("lakebase_profile_table") is False
+        self._verdicts(policy, {
+            "lakebase_read_query": True,
+            "lakebase_execute_query": True,
+            "lakebase_list_schemas": True,
+            "lakebase_create_branch": False,
+            "lakebase_profile_table": False,
+        })
 
     def test_no_profile_no_overrides(self):
         """No configuration means permissive (empty policy)."""
@@ -289,12 +299,13 @@ class TestResolveToolPolicy:
 class TestFullToolMatrixReadOnly:
     """Test every tool against read_only profile."""
 
-    @pytest.fixture
-    def policy(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def policy():
         return resolve_tool_policy(profile="read_only")
 
     # Tools that SHOULD be allowed in read_only
-    ALLOWED = [
+    ALLOWED = frozenset({
         "lakebase_execute_query",
         "lakebase_read_query",
         "lakebase_explain_query",
@@ -317,10 +328,10 @@ class TestFullToolMatrixReadOnly:
         "lakebase_check_my_access",
         "lakebase_governance_summary",
         "lakebase_list_catalog_grants",
-    ]
+    })
 
     # Tools that SHOULD be denied in read_only
-    DENIED = [
+    DENIED = frozenset({
         "lakebase_create_branch",
         "lakebase_delete_branch",
         "lakebase_configure_autoscaling",
@@ -330,44 +341,52 @@ class TestFullToolMatrixReadOnly:
         "lakebase_prepare_migration",
         "lakebase_complete_migration",
         "lakebase_create_sync",
-    ]
+    })
 
-    @pytest.mark.parametrize("tool", ALLOWED)
+    # Frozen parametrize inputs with explicit ids — skips saferepr-based
+    # ID generation during collection and keeps node IDs stable.
+    _ALLOWED_PARAMS = tuple(sorted(ALLOWED))
+    _DENIED_PARAMS = tuple(sorted(DENIED))
+
+    # Coverage drift is a property of these literals, not of runtime
+    # behavior — verify once at import instead of on every run.
+    assert ALLOWED | DENIED == ALL_TOOLS_SET, (
+        f"Uncovered/unknown tools: {ALL_TOOLS_SET ^ (ALLOWED | DENIED)}"
+    )
+
+    @pytest.mark.parametrize("tool", _ALLOWED_PARAMS, ids=_ALLOWED_PARAMS)
     def test_allowed_tools(self, policy, tool):
         assert policy.is_tool_allowed(tool) is True, f"{tool} should be ALLOWED in read_only"
 
-    @pytest.mark.parametrize("tool", DENIED)
+    @pytest.mark.parametrize("tool", _DENIED_PARAMS, ids=_DENIED_PARAMS)
     def test_denied_tools(self, policy, tool):
         assert policy.is_tool_allowed(tool) is False, f"{tool} should be DENIED in read_only"
 
-    def test_complete_coverage(self, policy):
-        """All 31 tools are covered in either ALLOWED or DENIED."""
-        covered = set(self.ALLOWED + self.DENIED)
-        assert covered == set(ALL_TOOLS), f"Missing tools: {set(ALL_TOOLS) - covered}"
-
 
 class TestFullToolMatrixDeveloper:
     """Test every tool against developer profile."""
 
-    @pytest.fixture
-    def policy(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def policy():
         return resolve_tool_policy(profile="developer")
 
     # All 31 tools should be allowed in developer
-    ALLOWED = ALL_TOOLS  # developer has all categories
+    ALLOWED = ALL_TOOLS_SET  # developer has all categories
 
-    @pytest.mark.parametrize("tool", ALL_TOOLS)
-    def test_all_tools_allowed(self, policy, tool):
-        assert policy.is_tool_allowed(tool) is True, f"{tool} should be ALLOWED in developer"
+    def test_all_tools_allowed(self, policy):
+        denied = {t for t in ALL_TOOLS if not policy.is_tool_allowed(t)}
+        assert denied == set(), f"Should be ALLOWED in developer: {denied}"
 
 
 class TestFullToolMatrixAdmin:
     """Test every tool against admin profile."""
 
-    @pytest.fixture
-    def policy(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def policy():
         return resolve_tool_policy(profile="admin")
 
-    @pytest.mark.parametrize("tool", ALL_TOOLS)
-    def test_all_tools_allowed(self, policy, tool):
-        assert policy.is_tool_allowed(tool) is True, f"{tool} should be ALLOWED in admin"
+    def test_all_tools_allowed(self, policy):
+        denied = {t for t in ALL_TOOLS if not policy.is_tool_allowed(t)}
+        assert denied == set(), f"Should be ALLOWED in admin: {denied}"
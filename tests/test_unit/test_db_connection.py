@@ -2,27 +2,56 @@
 import pytest
 import asyncio
 from contextlib import asynccontextmanager
-from unittest.mock import patch, AsyncMock, MagicMock
 import psycopg
 from server.db import LakebasePool
 
 
-def _make_pool_mock(side_effect=None, return_conn=None):
-    """Create a mock pool whose .connection() returns a proper async context manager.
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch):
+    """Replace retry backoff sleeps with a no-op that records delays.
+
+    Without this the max-retries test serializes real exponential
+    backoff waits (seconds of wall clock per run).
+    """
+    recorded = []
+
+    async def _instant(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr("server.db.asyncio.sleep", _instant)
+    return recorded
+
+
+class _FakeConn:
+    """Identity sentinel standing in for a psycopg connection."""
+
+
+class _FakePool:
+    """Minimal stand-in for psycopg_pool's AsyncConnectionPool.
 
-    psycopg_pool's .connection() returns an async context manager (not a coroutine),
-    so we need to replicate that behavior for the mock.
+    Only .connection() is exercised here; a concrete class avoids the
+    spec-building and call-tracking overhead of MagicMock/AsyncMock,
+    which dominated these tests' runtime.
     """
-    mock_pool = MagicMock()
+
+    def __init__(self, conn=None, exc=None):
+        self._conn = conn
+        self._exc = exc
 
     @asynccontextmanager
-    async def fake_connection():
-        if side_effect:
-            raise side_effect
-        yield return_conn
+    async def connection(self):
+        if self._exc:
+            raise self._exc
+        yield self._conn
+
 
-    mock_pool.connection = fake_connection
-    return mock_pool
+def _make_pool_mock(side_effect=None, return_conn=None):
+    """Build a fake pool whose .connection() raises or yields as configured.
+
+    psycopg_pool's .connection() returns an async context manager (not a
+    coroutine), so the fake replicates that shape.
+    """
+    return _FakePool(conn=return_conn, exc=side_effect)
 
 
 class TestScaleToZeroRetry:
@@ -39,24 +68,19 @@ class TestScaleToZeroRetry:
             async with pool.connection():
                 pass
 
-    async def test_retry_uses_exponential_backoff(self):
+    async def test_retry_uses_exponential_backoff(self, _fast_sleep):
         """Verify delays increase exponentially: 0.5s, 1s, 2s, 4s."""
-        delays = []
-
-        async def capture_sleep(delay):
-            delays.append(delay)
-
         pool = LakebasePool()
         pool._primary_pool = _make_pool_mock(
             side_effect=psycopg.OperationalError("connection refused")
         )
 
-        with patch("server.db.asyncio.sleep", side_effect=capture_sleep):
-            with pytest.raises(ConnectionError):
-                async with pool.connection():
-                    pass
+        with pytest.raises(ConnectionError):
+            async with pool.connection():
+                pass
 
         # Verify exponential backoff pattern (capped at max_delay)
+        delays = _fast_sleep
         assert len(delays) > 0
         for i in range(1, len(delays)):
             assert delays[i] >= delays[i - 1]  # Non-decreasing
@@ -67,20 +91,20 @@ class TestReplicaRouting:
 
     async def test_prefer_replica_uses_replica_pool(self):
         """When prefer_replica=True and replica pool exists, use it."""
-        mock_conn = AsyncMock()
+        sentinel = _FakeConn()
         pool = LakebasePool()
-        pool._primary_pool = _make_pool_mock(return_conn=AsyncMock())
-        pool._replica_pool = _make_pool_mock(return_conn=mock_conn)
+        pool._primary_pool = _make_pool_mock(return_conn=_FakeConn())
+        pool._replica_pool = _make_pool_mock(return_conn=sentinel)
 
         async with pool.connection(prefer_replica=True) as conn:
-            assert conn == mock_conn
+            assert conn is sentinel
 
     async def test_fallback_to_primary_without_replica(self):
         """When no replica pool, prefer_replica falls back to primary."""
-        mock_conn = AsyncMock()
+        sentinel = _FakeConn()
         pool = LakebasePool()
-        pool._primary_pool = _make_pool_mock(return_conn=mock_conn)
+        pool._primary_pool = _make_pool_mock(return_conn=sentinel)
         pool._replica_pool = None
 
         async with pool.connection(prefer_replica=True) as conn:
-            assert conn == mock_conn
+            assert conn is sentinel
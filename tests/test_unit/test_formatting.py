@@ -1,6 +1,10 @@
 """Unit tests for response formatting."""
-import json
 import pytest
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 from server.utils.formatting import (
     format_query_results,
     format_table_list,
@@ -22,7 +26,7 @@ class TestQueryResultFormatting:
 
     def test_results_json(self, sample_rows):
         result = format_query_results(sample_rows, fmt=ResponseFormat.JSON)
-        data = json.loads(result)
+        data = _json.loads(result)
         assert data["row_count"] == 2
         assert len(data["rows"]) == 2
 
@@ -43,6 +47,6 @@ class TestSchemaFormatting:
         result = format_schema_info(
             sample_columns, "public.users", fmt=ResponseFormat.JSON
         )
-        data = json.loads(result)
+        data = _json.loads(result)
         assert data["table"] == "public.users"
         assert len(data["columns"]) == 3
@@ -5,13 +5,14 @@ from server.governance.sql_guard import SQLGovernor, PROFILES
 from server.utils.formatting import ResponseFormat
 
 
+@pytest.fixture(scope="module")
+def gov():
+    return SQLGovernor(PROFILES["admin"])
+
+
 class TestWriteDetection:
     """Write detection now uses SQLGovernor.is_write() instead of WRITE_PATTERNS regex."""
 
-    @pytest.fixture
-    def gov(self):
-        return SQLGovernor(PROFILES["admin"])
-
     def test_select_is_not_write(self, gov):
         assert not gov.is_write("SELECT * FROM users")
 
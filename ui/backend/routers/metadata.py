@@ -3,7 +3,25 @@
 Imports governance data structures directly from server/ modules
 to stay in sync. Tool descriptions maintained here alongside source.
 """
-from fastapi import APIRouter
+import gzip
+import hashlib
+import json
+import sys
+from itertools import chain
+
+from fastapi import APIRouter, Request, Response
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as _DefaultResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 try:
     from server.governance.tool_guard import TOOL_CATEGORIES, TOOL_PROFILES
@@ -50,7 +68,10 @@ except ImportError:
         "admin": set(SQLStatementType),
     }
 
-router = APIRouter()
+# orjson serializes these dict/list payloads several times faster than
+# the stdlib encoder; fall back to the default JSONResponse when it
+# isn't installed.
+router = APIRouter(default_response_class=_DefaultResponse)
 
 # Static tool metadata — sourced from server/tools/*.py docstrings and annotations.
 # Each entry mirrors the @mcp.tool() registration in the corresponding tool file.
@@ -441,6 +462,28 @@ ENV_VARS = [
     {"name": "LAKEBASE_GOVERNANCE_CONFIG", "description": "Path to governance YAML config file", "required": False},
 ]
 
+def _intern_tree(node):
+    """Recursively sys.intern string keys/values in metadata literals.
+
+    The metadata dicts repeat the same short strings ("type", "string",
+    "required", "markdown", ...) hundreds of times; interning collapses
+    them to shared objects, shrinking the module's resident footprint
+    and making dict lookups pointer-fast.
+    """
+    if isinstance(node, str):
+        return sys.intern(node)
+    if isinstance(node, dict):
+        return {sys.intern(k): _intern_tree(v) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_intern_tree(v) for v in node]
+    return node
+
+
+TOOL_METADATA = _intern_tree(TOOL_METADATA)
+PROMPT_METADATA = _intern_tree(PROMPT_METADATA)
+RESOURCE_METADATA = _intern_tree(RESOURCE_METADATA)
+ENV_VARS = _intern_tree(ENV_VARS)
+
 CATEGORY_DESCRIPTIONS = {
     "sql_query": "SQL query execution with governance controls",
     "schema_read": "Schema and metadata discovery",
@@ -459,99 +502,215 @@ CATEGORY_DESCRIPTIONS = {
 }
 
 
-@router.get("/tools")
-async def get_tools():
+# ---------------------------------------------------------------------------
+# Pre-rendered payloads — everything above is a module constant, so each
+# endpoint's JSON is serialized exactly once at import and served as
+# cached bytes, skipping jsonable_encoder and the encoder per request.
+# ---------------------------------------------------------------------------
+
+
+def _dumps_bytes(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+class _StaticJSON:
+    """An immutable payload serialized once and served as raw bytes."""
+
+    __slots__ = ("payload", "body", "etag", "body_gz", "body_br")
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.body = _dumps_bytes(payload)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=8).hexdigest()}"'
+        # Compress once at import — repeated JSON keys compress well and
+        # per-request middleware compression would redo this every call.
+        # Only keep variants that actually shrink the payload.
+        gz = gzip.compress(self.body, compresslevel=9)
+        self.body_gz = gz if len(gz) < len(self.body) else None
+        br = brotli.compress(self.body, quality=11) if brotli is not None else None
+        self.body_br = br if br is not None and len(br) < len(self.body) else None
+
+    def response(self, request: Request | None = None) -> Response:
+        # The payload only changes on deploy, so warm UI clients can
+        # revalidate with If-None-Match and skip the body entirely.
+        headers = {
+            "etag": self.etag,
+            "cache-control": "public, max-age=300",
+            "vary": "accept-encoding",
+        }
+        if request is not None and request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+
+        body = self.body
+        if request is not None:
+            accepted = request.headers.get("accept-encoding", "")
+            if self.body_br is not None and "br" in accepted:
+                body = self.body_br
+                headers["content-encoding"] = "br"
+            elif self.body_gz is not None and "gzip" in accepted:
+                body = self.body_gz
+                headers["content-encoding"] = "gzip"
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _build_tools_payload() -> dict:
     tools = []
     for category, tool_names in TOOL_CATEGORIES.items():
         for tool_name in tool_names:
-            meta = TOOL_METADATA.get(tool_name, {})
-            tools.append({
-                "name": tool_name,
-                "category": category,
-                **meta,
-            })
+            record = {"name": tool_name, "category": category}
+            record.update(TOOL_METADATA.get(tool_name, {}))
+            tools.append(record)
     return {"tools": tools, "count": len(tools)}
 
 
-@router.get("/categories")
-async def get_categories():
-    categories = []
-    for cat, tool_names in TOOL_CATEGORIES.items():
-        categories.append({
+_TOOLS = _StaticJSON(_build_tools_payload())
+_CATEGORIES = _StaticJSON({
+    "categories": [
+        {
             "name": cat,
             "description": CATEGORY_DESCRIPTIONS.get(cat, ""),
             "tools": tool_names,
             "tool_count": len(tool_names),
-        })
-    return {"categories": categories, "count": len(categories)}
+        }
+        for cat, tool_names in TOOL_CATEGORIES.items()
+    ],
+    "count": len(TOOL_CATEGORIES),
+})
+_PROMPTS = _StaticJSON({"prompts": PROMPT_METADATA, "count": len(PROMPT_METADATA)})
+_RESOURCES = _StaticJSON({"resources": RESOURCE_METADATA, "count": len(RESOURCE_METADATA)})
+_ENV_VARS = _StaticJSON({"variables": ENV_VARS, "count": len(ENV_VARS)})
+_HEALTH = _StaticJSON({"status": "ok", "service": "lakebase-mcp-ui"})
 
 
-@router.get("/governance/matrix")
-async def get_governance_matrix():
-    matrix = {}
-    for profile_name, allowed_cats in TOOL_PROFILES.items():
-        allowed_tools = set()
-        for cat in allowed_cats:
-            if cat in TOOL_CATEGORIES:
-                allowed_tools.update(TOOL_CATEGORIES[cat])
-        matrix[profile_name] = {
+@router.get("/tools")
+async def get_tools(request: Request):
+    return _TOOLS.response(request)
+
+
+@router.get("/categories")
+async def get_categories(request: Request):
+    return _CATEGORIES.response(request)
+
+
+# Tool universe and per-profile expansions, shared by the builders below.
+_ALL_TOOLS = frozenset(chain.from_iterable(TOOL_CATEGORIES.values()))
+_ALLOWED_BY_PROFILE: dict[str, frozenset[str]] = {
+    profile: frozenset(
+        tool
+        for cat in cats
+        if cat in TOOL_CATEGORIES
+        for tool in TOOL_CATEGORIES[cat]
+    )
+    for profile, cats in TOOL_PROFILES.items()
+}
+
+
+def _build_governance_matrix() -> dict:
+    return {
+        profile_name: {
             tool: tool in allowed_tools
             for cat_tools in TOOL_CATEGORIES.values()
             for tool in cat_tools
         }
-    return matrix
+        for profile_name, allowed_tools in _ALLOWED_BY_PROFILE.items()
+    }
 
 
-@router.get("/governance/sql-matrix")
-async def get_sql_matrix():
-    all_types = sorted(t.value for t in SQLStatementType)
+# SQL type universe and per-profile value lists, sorted once.
+_ALL_SQL_TYPES: tuple[str, ...] = tuple(sorted(t.value for t in SQLStatementType))
+_SQL_ALLOWED_BY_PROFILE: dict[str, tuple[str, ...]] = {
+    profile: tuple(sorted(t.value for t in allowed))
+    for profile, allowed in SQL_PROFILES.items()
+}
+
+
+def _build_sql_matrix() -> dict:
     matrix = {}
-    for profile_name, allowed_set in SQL_PROFILES.items():
-        allowed_values = {t.value for t in allowed_set}
+    for profile_name, allowed_values in _SQL_ALLOWED_BY_PROFILE.items():
+        allowed = frozenset(allowed_values)
         matrix[profile_name] = {
-            sql_type: sql_type in allowed_values
-            for sql_type in all_types
+            sql_type: sql_type in allowed
+            for sql_type in _ALL_SQL_TYPES
         }
-    return {"types": all_types, "profiles": matrix}
+    return {"types": list(_ALL_SQL_TYPES), "profiles": matrix}
 
 
-@router.get("/governance/profiles")
-async def get_profiles():
+def _build_profiles_payload() -> dict:
     profiles = {}
     for profile_name, allowed_cats in TOOL_PROFILES.items():
-        allowed_tools = set()
-        for cat in allowed_cats:
-            if cat in TOOL_CATEGORIES:
-                allowed_tools.update(TOOL_CATEGORIES[cat])
-        all_tools = {t for tools in TOOL_CATEGORIES.values() for t in tools}
-        sql_allowed = sorted(t.value for t in SQL_PROFILES.get(profile_name, set()))
+        allowed_tools = _ALLOWED_BY_PROFILE[profile_name]
         profiles[profile_name] = {
             "tool_categories": allowed_cats,
             "tools_allowed": len(allowed_tools),
-            "tools_denied": len(all_tools - allowed_tools),
-            "sql_types_allowed": sql_allowed,
+            "tools_denied": len(_ALL_TOOLS - allowed_tools),
+            "sql_types_allowed": list(_SQL_ALLOWED_BY_PROFILE.get(profile_name, ())),
         }
     return profiles
 
 
+_GOVERNANCE_MATRIX = _StaticJSON(_build_governance_matrix())
+_SQL_MATRIX = _StaticJSON(_build_sql_matrix())
+_PROFILES = _StaticJSON(_build_profiles_payload())
+
+
+@router.get("/governance/matrix")
+async def get_governance_matrix(request: Request):
+    return _GOVERNANCE_MATRIX.response(request)
+
+
+@router.get("/governance/sql-matrix")
+async def get_sql_matrix(request: Request):
+    return _SQL_MATRIX.response(request)
+
+
+@router.get("/governance/profiles")
+async def get_profiles(request: Request):
+    return _PROFILES.response(request)
+
+
 @router.get("/prompts")
-async def get_prompts():
-    return {"prompts": PROMPT_METADATA, "count": len(PROMPT_METADATA)}
+async def get_prompts(request: Request):
+    return _PROMPTS.response(request)
 
 
 @router.get("/resources")
-async def get_resources():
-    return {"resources": RESOURCE_METADATA, "count": len(RESOURCE_METADATA)}
+async def get_resources(request: Request):
+    return _RESOURCES.response(request)
 
 
 @router.get("/config/env-vars")
-async def get_env_vars():
-    return {"variables": ENV_VARS, "count": len(ENV_VARS)}
+async def get_env_vars(request: Request):
+    return _ENV_VARS.response(request)
+
+
+# Everything the UI fetches on mount, as one payload — all sources are
+# immutable module constants, so the bundle is built once at import and
+# the individual endpoints stay only for backward compat.
+_BUNDLE = _StaticJSON({
+    "tools": _TOOLS.payload,
+    "categories": _CATEGORIES.payload,
+    "governance": {
+        "matrix": _GOVERNANCE_MATRIX.payload,
+        "sql_matrix": _SQL_MATRIX.payload,
+        "profiles": _PROFILES.payload,
+    },
+    "prompts": _PROMPTS.payload,
+    "resources": _RESOURCES.payload,
+    "env_vars": _ENV_VARS.payload,
+})
+
+
+@router.get("/bundle")
+async def get_bundle(request: Request):
+    return _BUNDLE.response(request)
 
 
 @router.get("/health")
 async def health():
-    return {"status": "ok", "service": "lakebase-mcp-ui"}
+    # Health is polled for liveness — never served from cache.
+    return Response(content=_HEALTH.body, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -668,16 +827,23 @@ COMPARISON_PRICING = {
 }
 
 
+# Pricing tables are as static as the metadata above — same pre-rendered
+# treatment (bytes + ETag + compression negotiated per request).
+_MODEL_PRICING = _StaticJSON(MODEL_PRICING)
+_COMPUTE_PRICING = _StaticJSON(COMPUTE_PRICING)
+_COMPARISON_PRICING = _StaticJSON(COMPARISON_PRICING)
+
+
 @router.get("/pricing/models")
-async def get_model_pricing():
-    return MODEL_PRICING
+async def get_model_pricing(request: Request):
+    return _MODEL_PRICING.response(request)
 
 
 @router.get("/pricing/compute")
-async def get_compute_pricing():
-    return COMPUTE_PRICING
+async def get_compute_pricing(request: Request):
+    return _COMPUTE_PRICING.response(request)
 
 
 @router.get("/pricing/comparison")
-async def get_comparison_pricing():
-    return COMPARISON_PRICING
+async def get_comparison_pricing(request: Request):
+    return _COMPARISON_PRICING.response(request)
@@ -1,4 +1,6 @@
 """Build the UI: compile React frontend and copy to backend/static/."""
+import hashlib
+import os
 import subprocess
 import shutil
 from pathlib import Path
@@ -8,9 +10,103 @@ FRONTEND_DIR = UI_DIR / "frontend"
 STATIC_DIR = UI_DIR / "backend" / "static"
 
 
+def _install_dependencies():
+    """Run npm install only when package-lock.json changed since the last run.
+
+    The lockfile hash is stamped into node_modules/.install-stamp after a
+    successful install; a matching stamp means the dependency tree is
+    already correct and the install can be skipped outright.
+    """
+    lockfile = FRONTEND_DIR / "package-lock.json"
+    stamp = FRONTEND_DIR / "node_modules" / ".install-stamp"
+    lock_hash = (
+        hashlib.sha256(lockfile.read_bytes()).hexdigest()
+        if lockfile.exists()
+        else ""
+    )
+    if lock_hash and stamp.exists() and stamp.read_text() == lock_hash:
+        print("Dependencies up to date (lockfile unchanged) — skipping npm install")
+        return
+
+    # npm ci is deterministic and faster than install from a clean slate.
+    clean = lock_hash and not (FRONTEND_DIR / "node_modules").exists()
+    subprocess.run(["npm", "ci" if clean else "install"], cwd=FRONTEND_DIR, check=True)
+    if lock_hash:
+        stamp.write_text(lock_hash)
+
+
+def _source_hash() -> str:
+    """Hash every frontend build input: src/**, index.html, configs, lockfile."""
+    digest = hashlib.sha256()
+    inputs = [
+        FRONTEND_DIR / "index.html",
+        FRONTEND_DIR / "package.json",
+        FRONTEND_DIR / "package-lock.json",
+        *sorted(FRONTEND_DIR.glob("vite.config.*")),
+        *sorted(p for p in (FRONTEND_DIR / "src").rglob("*") if p.is_file()),
+    ]
+    for path in inputs:
+        if path.exists():
+            digest.update(str(path.relative_to(FRONTEND_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _mirror(src: Path, dst: Path):
+    """Mirror src into dst, copying only changed files and pruning strays.
+
+    A file is unchanged when size and mtime match (copy2 preserves both),
+    so a warm rebuild rewrites only the assets the bundler actually
+    regenerated instead of the whole static tree.
+    """
+    copied = 0
+    src_files = set()
+    for root, _dirs, files in os.walk(src):
+        rel = Path(root).relative_to(src)
+        (dst / rel).mkdir(parents=True, exist_ok=True)
+        for name in files:
+            src_file = Path(root) / name
+            dst_file = dst / rel / name
+            src_files.add(rel / name)
+            src_stat = src_file.stat()
+            try:
+                dst_stat = dst_file.stat()
+                if (
+                    dst_stat.st_size == src_stat.st_size
+                    and dst_stat.st_mtime == src_stat.st_mtime
+                ):
+                    continue
+            except FileNotFoundError:
+                pass
+            shutil.copy2(src_file, dst_file)
+            copied += 1
+
+    # Prune anything in dst that no longer exists in src.
+    for root, dirs, files in os.walk(dst, topdown=False):
+        rel = Path(root).relative_to(dst)
+        for name in files:
+            if rel / name not in src_files:
+                (dst / rel / name).unlink()
+        for name in dirs:
+            if not (src / rel / name).exists():
+                try:
+                    (dst / rel / name).rmdir()
+                except OSError:
+                    pass
+    return copied
+
+
 def build():
+    # Skip the whole build when no input changed since the last run —
+    # the hash covers sources, configs, and the dependency lockfile.
+    src_hash = _source_hash()
+    hash_file = STATIC_DIR / ".build-hash"
+    if hash_file.exists() and hash_file.read_text() == src_hash:
+        print(f"Frontend up to date — skipping build ({STATIC_DIR})")
+        return
+
     print("=== Installing frontend dependencies ===")
-    subprocess.run(["npm", "install"], cwd=FRONTEND_DIR, check=True)
+    _install_dependencies()
 
     print("\n=== Building frontend ===")
     subprocess.run(["npm", "run", "build"], cwd=FRONTEND_DIR, check=True)
@@ -20,10 +116,9 @@ def build():
     if not dist_dir.exists():
         raise RuntimeError(f"Build output not found at {dist_dir}")
 
-    if STATIC_DIR.exists():
-        shutil.rmtree(STATIC_DIR)
-    shutil.copytree(dist_dir, STATIC_DIR)
-    print(f"Frontend built and copied to {STATIC_DIR}")
+    copied = _mirror(dist_dir, STATIC_DIR)
+    hash_file.write_text(src_hash)
+    print(f"Frontend built and mirrored to {STATIC_DIR} ({copied} files updated)")
 
     # Count files
     files = list(STATIC_DIR.rglob("*"))